@@ -162,6 +162,11 @@ class BacktestDataConfig(NautilusConfig, frozen=True):
         The metadata for the data catalog query.
     bar_spec : str, optional
         The bar specification for the data catalog query.
+    columns : list[str], optional
+        The columns to project when querying custom data from the catalog.
+        If ``None`` then all columns are read. Only applicable to data types
+        queried through `pyarrow` (column projection cannot be applied when
+        deserializing built-in Nautilus objects, which require the full schema).
 
     """
 
@@ -176,6 +181,7 @@ class BacktestDataConfig(NautilusConfig, frozen=True):
     client_id: str | None = None
     metadata: dict | None = None
     bar_spec: str | None = None
+    columns: list[str] | None = None
 
     @property
     def data_type(self) -> type:
@@ -215,6 +221,7 @@ class BacktestDataConfig(NautilusConfig, frozen=True):
             "end": self.end_time,
             "filter_expr": parse_filters_expr(filter_expr),
             "metadata": self.metadata,
+            "columns": self.columns,
         }
 
     @property
@@ -317,6 +324,18 @@ class BacktestRunConfig(NautilusConfig, frozen=True):
     chunk_size : int, optional
         The number of data points to process in each chunk during streaming mode.
         If `None`, the backtest will run without streaming, loading all data at once.
+        Streaming keeps peak memory bounded independent of total dataset size, so
+        it is the recommended mode for datasets which do not comfortably fit in
+        memory; the one-shot mode remains preferable for small datasets where the
+        per-chunk overhead outweighs the memory cost.
+        Note each chunk is fed to the engine in smaller morsels of `morsel_size`
+        events, so `chunk_size` controls how much data is read from the catalog
+        at a time while `morsel_size` controls how much is processed at a time.
+    morsel_size : int, optional
+        The maximum number of events fed to the engine per streaming iteration.
+        Defaults to 8192, chosen to keep the working set for each iteration
+        small enough to remain resident in CPU cache. Only applies when
+        `chunk_size` is set.
     dispose_on_completion : bool, default True
         If the backtest engine should be disposed on completion of the run.
         If True, then will drop data and all state.
@@ -340,6 +359,7 @@ class BacktestRunConfig(NautilusConfig, frozen=True):
     data: list[BacktestDataConfig]
     engine: BacktestEngineConfig | None = None
     chunk_size: int | None = None
+    morsel_size: int | None = None
     dispose_on_completion: bool = True
     start: str | int | None = None
     end: str | int | None = None
@@ -13,9 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import time
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-
-import pandas as pd
+from functools import cache
+from functools import partial
 
 from nautilus_trader.backtest.config import BacktestDataConfig
 from nautilus_trader.backtest.config import BacktestRunConfig
@@ -52,6 +56,23 @@ from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.persistence.catalog.types import CatalogDataResult
 
 
+@cache
+def _parse_currency(value: str) -> Currency:
+    return Currency.from_str(value)
+
+
+@cache
+def _parse_money(value: str) -> Money:
+    return Money.from_str(value)
+
+
+# The default maximum number of events fed to the engine per streaming
+# iteration (overridable per run via `BacktestRunConfig.morsel_size`).
+# Keeps the working set for each iteration small enough to remain resident
+# in CPU cache, rather than processing row-group-sized chunks in one pass.
+_STREAMING_MORSEL_SIZE = 8192
+
+
 class BacktestNode:
     """
     Provides a node for orchestrating groups of backtest runs.
@@ -60,6 +81,11 @@ class BacktestNode:
     ----------
     configs : list[BacktestRunConfig]
         The backtest run configurations.
+    validate : bool, default True
+        If the run configs should be semantically validated on initialization
+        (venue coverage for instruments, time range ordering, order book data
+        availability). May be disabled for large programmatically generated
+        sweeps where every config derives from an already validated template.
 
     Raises
     ------
@@ -70,7 +96,7 @@ class BacktestNode:
 
     """
 
-    def __init__(self, configs: list[BacktestRunConfig]):
+    def __init__(self, configs: list[BacktestRunConfig], validate: bool = True):
         PyCondition.not_none(configs, "configs")
         PyCondition.not_empty(configs, "configs")
         PyCondition.is_true(
@@ -78,7 +104,8 @@ class BacktestNode:
             "configs",
         )
 
-        self._validate_configs(configs)
+        if validate:
+            self._validate_configs(configs)
 
         self._configs: list[BacktestRunConfig] = configs
         self._engines: dict[str, BacktestEngine] = {}
@@ -136,7 +163,12 @@ class BacktestNode:
         """
         return list(self._engines.values())
 
-    def run(self, raise_exception=False) -> list[BacktestResult]:
+    def run(
+        self,
+        raise_exception=False,
+        parallel: int = 1,
+        reuse_engine: bool = False,
+    ) -> list[BacktestResult]:
         """
         Run the backtest node which will synchronously execute the list of loaded
         backtest run configs.
@@ -146,6 +178,19 @@ class BacktestNode:
         raise_exception : bool, default False
             If True, an exception raised from a backtest will be re-raised and halt the node.
             If False, exceptions raised from backtest(s) will be printed to stdout.
+        parallel : int, default 1
+            The number of worker processes to distribute the backtest runs across.
+            If greater than one, each run config is executed in a separate worker
+            process (runs are independent), with results returned in config order.
+            Engines are then constructed inside the workers, so `get_engine` and
+            `get_engines` will not return engines for parallel runs.
+        reuse_engine : bool, default False
+            If the backtest engine should be reused between successive runs which
+            share identical engine, venue and data configs (e.g. sweeps over run
+            `start` / `end` windows). The engine is `reset()` between runs rather
+            than reconstructed, retaining venues and instruments. Reuse requires
+            `dispose_on_completion=False` on the run configs, and does not apply
+            to parallel runs.
 
         Returns
         -------
@@ -153,8 +198,21 @@ class BacktestNode:
             The results of the backtest runs.
 
         """
+        PyCondition.positive_int(parallel, "parallel")
+        for config in self._configs:
+            if config.morsel_size is not None:
+                PyCondition.positive_int(config.morsel_size, "config.morsel_size")
+
+        if parallel > 1:
+            return self._run_parallel(max_workers=parallel, raise_exception=raise_exception)
+
         results: list[BacktestResult] = []
+        engine: BacktestEngine | None = None
+        engine_signature = None
         for config in self._configs:
+            signature = (config.engine, config.venues, config.data)
+            if not reuse_engine or signature != engine_signature:
+                engine = None
             try:
                 result = self._run(
                     run_config_id=config.id,
@@ -162,12 +220,22 @@ class BacktestNode:
                     venue_configs=config.venues,
                     data_configs=config.data,
                     chunk_size=config.chunk_size,
+                    morsel_size=config.morsel_size,
                     dispose_on_completion=config.dispose_on_completion,
                     start=config.start,
                     end=config.end,
+                    engine=engine,
                 )
                 results.append(result)
+
+                # Only retain the engine for reuse when it survives the run
+                if reuse_engine and not config.dispose_on_completion:
+                    engine = self._engines.get(config.id)
+                    engine_signature = signature
+                else:
+                    engine = None
             except Exception as e:
+                engine = None
                 # Broad catch all prevents a single backtest run from halting
                 # the execution of the other backtests (such as a zero balance exception).
                 if not is_logging_initialized():
@@ -181,10 +249,21 @@ class BacktestNode:
 
         return results
 
+    def _run_parallel(self, max_workers: int, raise_exception: bool) -> list[BacktestResult]:
+        # Engines hold non-picklable state, so configs are passed to the workers
+        # as serialized JSON and each worker runs a fresh single-config node.
+        raw_configs = [config.json() for config in self._configs]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                partial(_run_backtest_config, raise_exception=raise_exception),
+                raw_configs,
+            )
+            return [result for result in results if result is not None]
+
     def _validate_configs(self, configs: list[BacktestRunConfig]) -> None:  # noqa: C901
-        venue_ids: list[Venue] = []
+        venue_ids: set[Venue] = set()
         for config in configs:
-            venue_ids += [Venue(c.name) for c in config.venues]
+            venue_ids.update(Venue(c.name) for c in config.venues)
 
         for config in configs:
             for data_config in config.data:
@@ -243,45 +322,70 @@ class BacktestNode:
             self._log_guard = log_guard
 
         # Add venues (must be added prior to instruments)
-        for config in venue_configs:
-            base_currency: str | None = config.base_currency
+        # Note the loop variable must not shadow the engine `config` parameter
+        for venue_config in venue_configs:
+            base_currency: str | None = venue_config.base_currency
             leverages = (
-                {InstrumentId.from_str(i): Decimal(v) for i, v in config.leverages.items()}
-                if config.leverages
+                {InstrumentId.from_str(i): Decimal(v) for i, v in venue_config.leverages.items()}
+                if venue_config.leverages
                 else {}
             )
 
             engine.add_venue(
-                venue=Venue(config.name),
-                oms_type=OmsType[config.oms_type],
-                account_type=AccountType[config.account_type],
-                base_currency=Currency.from_str(base_currency) if base_currency else None,
-                starting_balances=[Money.from_str(m) for m in config.starting_balances],
-                default_leverage=Decimal(config.default_leverage),
+                venue=Venue(venue_config.name),
+                oms_type=OmsType[venue_config.oms_type],
+                account_type=AccountType[venue_config.account_type],
+                base_currency=_parse_currency(base_currency) if base_currency else None,
+                starting_balances=[_parse_money(m) for m in venue_config.starting_balances],
+                default_leverage=Decimal(venue_config.default_leverage),
                 leverages=leverages,
-                book_type=book_type_from_str(config.book_type),
-                routing=config.routing,
-                modules=[ActorFactory.create(module) for module in (config.modules or [])],
-                frozen_account=config.frozen_account,
-                reject_stop_orders=config.reject_stop_orders,
-                support_gtd_orders=config.support_gtd_orders,
-                support_contingent_orders=config.support_contingent_orders,
-                use_position_ids=config.use_position_ids,
-                use_random_ids=config.use_random_ids,
-                use_reduce_only=config.use_reduce_only,
+                book_type=book_type_from_str(venue_config.book_type),
+                routing=venue_config.routing,
+                modules=[ActorFactory.create(module) for module in (venue_config.modules or [])],
+                frozen_account=venue_config.frozen_account,
+                reject_stop_orders=venue_config.reject_stop_orders,
+                support_gtd_orders=venue_config.support_gtd_orders,
+                support_contingent_orders=venue_config.support_contingent_orders,
+                use_position_ids=venue_config.use_position_ids,
+                use_random_ids=venue_config.use_random_ids,
+                use_reduce_only=venue_config.use_reduce_only,
             )
 
-        # Add instruments
-        for config in data_configs:
-            if is_nautilus_class(config.data_type):
-                catalog = self.load_catalog(config)
-                instruments = catalog.instruments(instrument_ids=config.instrument_id)
-                for instrument in instruments or []:
-                    if instrument.id not in engine.cache.instrument_ids():
-                        engine.add_instrument(instrument)
+        self._add_instruments(engine, data_configs)
 
         return engine
 
+    def _add_instruments(
+        self,
+        engine: BacktestEngine,
+        data_configs: list[BacktestDataConfig],
+    ) -> None:
+        # Gather the instrument IDs required from each catalog first so the
+        # instruments are read in a single scan per catalog (rather than one
+        # scan per data config).
+        catalogs: dict[tuple[str, str | None], ParquetDataCatalog] = {}
+        instrument_ids: dict[tuple[str, str | None], set[InstrumentId] | None] = {}
+        for data_config in data_configs:
+            if not is_nautilus_class(data_config.data_type):
+                continue
+            key = (data_config.catalog_path, data_config.catalog_fs_protocol)
+            if key not in catalogs:
+                catalogs[key] = self.load_catalog(data_config)
+                instrument_ids[key] = set()
+            if data_config.instrument_id is None:
+                instrument_ids[key] = None  # Load all instruments from the catalog
+            else:
+                ids = instrument_ids[key]
+                if ids is not None:
+                    ids.add(data_config.instrument_id)
+
+        for key, catalog in catalogs.items():
+            ids = instrument_ids[key]
+            instruments = catalog.instruments(instrument_ids=list(ids) if ids else None)
+            for instrument in instruments or []:
+                if instrument.id not in engine.cache.instrument_ids():
+                    engine.add_instrument(instrument)
+
     def _load_engine_data(self, engine: BacktestEngine, result: CatalogDataResult) -> None:
         if is_nautilus_class(result.data_cls):
             engine.add_data(
@@ -306,16 +410,24 @@ class BacktestNode:
         venue_configs: list[BacktestVenueConfig],
         data_configs: list[BacktestDataConfig],
         chunk_size: int | None,
+        morsel_size: int | None,
         dispose_on_completion: bool,
         start: str | int | None = None,
         end: str | int | None = None,
+        engine: BacktestEngine | None = None,
     ) -> BacktestResult:
-        engine: BacktestEngine = self._create_engine(
-            run_config_id=run_config_id,
-            config=engine_config,
-            venue_configs=venue_configs,
-            data_configs=data_configs,
-        )
+        if engine is None:
+            engine = self._create_engine(
+                run_config_id=run_config_id,
+                config=engine_config,
+                venue_configs=venue_configs,
+                data_configs=data_configs,
+            )
+        else:
+            # Reusing the engine from the previous run (venues and
+            # instruments are retained, data is reloaded per run)
+            self._engines[run_config_id] = engine
+            engine.reset()
 
         # Run backtest
         if chunk_size is not None:
@@ -324,6 +436,7 @@ class BacktestNode:
                 engine=engine,
                 data_configs=data_configs,
                 chunk_size=chunk_size,
+                morsel_size=morsel_size,
                 start=start,
                 end=end,
             )
@@ -351,6 +464,7 @@ class BacktestNode:
         engine: BacktestEngine,
         data_configs: list[BacktestDataConfig],
         chunk_size: int,
+        morsel_size: int | None,
         start: str | int | None = None,
         end: str | int | None = None,
     ) -> None:
@@ -389,18 +503,28 @@ class BacktestNode:
 
         # Stream data
         for chunk in session.to_query_result():
-            engine.add_data(
-                data=capsule_to_list(chunk),
-                validate=False,  # Cannot validate mixed type stream
-                sort=True,  # Already sorted from backend
-            )
-            engine.run(
-                start=start,
-                end=end,
-                run_config_id=run_config_id,
-                streaming=True,
-            )
-            engine.clear_data()
+            data = capsule_to_list(chunk)
+
+            # Process over-sized chunks in smaller morsels
+            max_size = morsel_size or _STREAMING_MORSEL_SIZE
+            if len(data) <= max_size:
+                morsels = [data]
+            else:
+                morsels = [data[i : i + max_size] for i in range(0, len(data), max_size)]
+
+            for morsel in morsels:
+                engine.add_data(
+                    data=morsel,
+                    validate=False,  # Cannot validate mixed type stream
+                    sort=True,  # Already sorted from backend
+                )
+                engine.run(
+                    start=start,
+                    end=end,
+                    run_config_id=run_config_id,
+                    streaming=True,
+                )
+                engine.clear_data()
 
         engine.end()
 
@@ -412,29 +536,44 @@ class BacktestNode:
         start: str | int | None = None,
         end: str | int | None = None,
     ) -> None:
-        # Load data
-        for config in data_configs:
-            t0 = pd.Timestamp.now()
-            engine.logger.info(
-                f"Reading {config.data_type} data for instrument={config.instrument_id}.",
-            )
-            result: CatalogDataResult = self.load_data_config(config, start, end)
-            if config.instrument_id and result.instrument is None:
-                engine.logger.warning(
-                    f"Requested instrument_id={result.instrument} from data_config not found in catalog",
+        # Load data, prefetching the next config's catalog read (I/O bound,
+        # Arrow releases the GIL) on a worker thread while the current result
+        # is being loaded into the engine. Catalog instances are shared per
+        # (path, protocol) via the `Singleton` metaclass, so the worker may
+        # operate on the same catalog as the main thread; this is safe because
+        # the query path is read-only and keeps no mutable query state on the
+        # catalog.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future: Future | None = None
+            for i, config in enumerate(data_configs):
+                t0 = time.perf_counter_ns()
+                engine.logger.info(
+                    f"Reading {config.data_type} data for instrument={config.instrument_id}.",
                 )
-                continue
-            if not result.data:
-                engine.logger.warning(f"No data found for {config}")
-                continue
-
-            t1 = pd.Timestamp.now()
-            engine.logger.info(
-                f"Read {len(result.data):,} events from parquet in {pd.Timedelta(t1 - t0)}s",
-            )
-            self._load_engine_data(engine=engine, result=result)
-            t2 = pd.Timestamp.now()
-            engine.logger.info(f"Engine load took {pd.Timedelta(t2 - t1)}s")
+                if future is None:
+                    future = executor.submit(self.load_data_config, config, start, end)
+                result: CatalogDataResult = future.result()
+                if i + 1 < len(data_configs):
+                    future = executor.submit(self.load_data_config, data_configs[i + 1], start, end)
+                else:
+                    future = None
+
+                if config.instrument_id and result.instrument is None:
+                    engine.logger.warning(
+                        f"Requested instrument_id={result.instrument} from data_config not found in catalog",
+                    )
+                    continue
+                if not result.data:
+                    engine.logger.warning(f"No data found for {config}")
+                    continue
+
+                t1 = time.perf_counter_ns()
+                engine.logger.info(
+                    f"Read {len(result.data):,} events from parquet in {(t1 - t0) / 1_000_000_000:.3f}s",
+                )
+                self._load_engine_data(engine=engine, result=result)
+                t2 = time.perf_counter_ns()
+                engine.logger.info(f"Engine load took {(t2 - t1) / 1_000_000_000:.3f}s")
 
         engine.run(start=start, end=end, run_config_id=run_config_id)
 
@@ -482,3 +621,11 @@ class BacktestNode:
         for engine in self.get_engines():
             if not engine.trader.is_disposed:
                 engine.dispose()
+
+
+def _run_backtest_config(raw_config: bytes, raise_exception: bool) -> BacktestResult | None:
+    # Top-level function so it can be pickled for `ProcessPoolExecutor` workers
+    config = BacktestRunConfig.parse(raw_config)
+    node = BacktestNode(configs=[config], validate=False)  # Validated by the parent node
+    results = node.run(raise_exception=raise_exception)
+    return results[0] if results else None
@@ -19,6 +19,7 @@ import hashlib
 import importlib
 from collections.abc import Callable
 from decimal import Decimal
+from functools import cache
 from typing import Annotated, Any
 
 import msgspec
@@ -64,6 +65,7 @@ class InvalidConfiguration(RuntimeError):
     """
 
 
+@cache
 def resolve_path(path: str) -> type:
     module, cls_str = path.rsplit(":", maxsplit=1)
     mod = importlib.import_module(module)
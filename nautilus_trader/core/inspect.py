@@ -15,9 +15,11 @@
 
 import gc
 import sys
+from functools import cache
 from typing import Any
 
 
+@cache
 def is_nautilus_class(cls: type) -> bool:
     """
     Determine whether a class is a builtin nautilus type.
@@ -20,6 +20,9 @@ from abc import ABCMeta
 from abc import abstractmethod
 from typing import Any
 
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import init_logging
+from nautilus_trader.common.component import is_logging_initialized
 from nautilus_trader.core.data import Data
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import CustomData
@@ -79,7 +82,9 @@ class BaseDataCatalog(ABC, metaclass=_CombinedMeta):
                 objs = self.query(data_cls=cls, instrument_ids=instrument_ids, **kwargs)
                 objects.extend(objs)
             except AssertionError as e:
-                print(e)
+                if not is_logging_initialized():
+                    init_logging()
+                Logger(type(self).__name__).warning(str(e))
                 continue
 
         return objects
@@ -165,7 +170,8 @@ class BaseDataCatalog(ABC, metaclass=_CombinedMeta):
         if as_nautilus:
             if data is None:
                 return []
-            return [CustomData(data_type=DataType(cls, metadata=metadata), data=d) for d in data]
+            data_type = DataType(cls, metadata=metadata)
+            return [CustomData(data_type=data_type, data=d) for d in data]
         return data
 
     @abstractmethod
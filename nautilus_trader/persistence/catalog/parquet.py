@@ -21,7 +21,6 @@ import platform
 from collections import defaultdict
 from collections.abc import Callable
 from collections.abc import Generator
-from itertools import groupby
 from os import PathLike
 from pathlib import Path
 from typing import Any, NamedTuple
@@ -36,6 +35,9 @@ from fsspec.implementations.memory import MemoryFileSystem
 from fsspec.utils import infer_storage_options
 from pyarrow import ArrowInvalid
 
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import init_logging
+from nautilus_trader.common.component import is_logging_initialized
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.data import Data
 from nautilus_trader.core.datetime import dt_to_unix_nanos
@@ -74,6 +76,17 @@ class FeatherFile(NamedTuple):
 _NAUTILUS_PATH = "NAUTILUS_PATH"
 _DEFAULT_FS_PROTOCOL = "file"
 
+# Data classes which can be queried through the Rust parquet backend,
+# mapped to their corresponding backend data type
+_NAUTILUS_DATA_TYPES: dict[type, NautilusDataType] = {
+    OrderBookDelta: NautilusDataType.OrderBookDelta,
+    OrderBookDeltas: NautilusDataType.OrderBookDelta,
+    OrderBookDepth10: NautilusDataType.OrderBookDepth10,
+    QuoteTick: NautilusDataType.QuoteTick,
+    TradeTick: NautilusDataType.TradeTick,
+    Bar: NautilusDataType.Bar,
+}
+
 
 class ParquetDataCatalog(BaseDataCatalog):
     """
@@ -128,7 +141,11 @@ class ParquetDataCatalog(BaseDataCatalog):
     ) -> None:
         self.fs_protocol: str = fs_protocol or _DEFAULT_FS_PROTOCOL
         if isinstance(self.fs_protocol, str) and self.fs_protocol.startswith("("):
-            print(f"Unexpected `fs_protocol` format: {self.fs_protocol}, defaulting to 'file'")
+            if not is_logging_initialized():
+                init_logging()
+            Logger(type(self).__name__).warning(
+                f"Unexpected `fs_protocol` format: {self.fs_protocol}, defaulting to 'file'",
+            )
             self.fs_protocol = "file"
 
         self.fs_storage_options = fs_storage_options or {}
@@ -351,7 +368,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         Notes
         -----
          - All data of the same type is expected to be monotonically increasing, or non-decreasing.
-         - The data is sorted and grouped based on its class name and instrument ID (if applicable) before writing.
+         - The data is grouped based on its class name and instrument ID (if applicable) before writing, preserving the relative order within each group.
          - Instrument-specific data should have either an `instrument_id` attribute or be an instance of `Instrument`.
          - The `Bar` class is treated as a special case, being grouped based on its `bar_type` attribute.
          - The input data list must be non-empty, and all data items must be of the appropriate class type.
@@ -380,8 +397,14 @@ class ParquetDataCatalog(BaseDataCatalog):
             return type(obj) if not isinstance(obj, CustomData) else obj.data.__class__
 
         name_to_cls = {cls.__name__: cls for cls in {obj_to_type(d) for d in data}}
-        for (cls_name, instrument_id), single_type in groupby(sorted(data, key=key), key=key):
-            chunk = list(single_type)
+
+        # Bucket the data in a single pass, preserving the relative order of
+        # each group (avoids sorting the entire batch just to group it).
+        buckets: dict[tuple[str, str | None], list[Data]] = defaultdict(list)
+        for obj in data:
+            buckets[key(obj)].append(obj)
+
+        for (cls_name, instrument_id), chunk in buckets.items():
             self.write_chunk(
                 data=chunk,
                 data_cls=name_to_cls[cls_name],
@@ -403,14 +426,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         where: str | None = None,
         **kwargs: Any,
     ) -> list[Data | CustomData]:
-        if self.fs_protocol == "file" and data_cls in (
-            OrderBookDelta,
-            OrderBookDeltas,
-            OrderBookDepth10,
-            QuoteTick,
-            TradeTick,
-            Bar,
-        ):
+        if self.fs_protocol == "file" and data_cls in _NAUTILUS_DATA_TYPES:
             data = self.query_rust(
                 data_cls=data_cls,
                 instrument_ids=instrument_ids,
@@ -433,10 +449,8 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         if not is_nautilus_class(data_cls):
             # Special handling for generic data
-            data = [
-                CustomData(data_type=DataType(data_cls, metadata=kwargs.get("metadata")), data=d)
-                for d in data
-            ]
+            data_type = DataType(data_cls, metadata=kwargs.get("metadata"))
+            data = [CustomData(data_type=data_type, data=d) for d in data]
         return data
 
     def backend_session(
@@ -544,6 +558,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         start: TimestampLike | None = None,
         end: TimestampLike | None = None,
         filter_expr: str | None = None,
+        columns: list[str] | None = None,
         **kwargs: Any,
     ) -> list[Data]:
         file_prefix = class_to_filename(data_cls)
@@ -557,6 +572,7 @@ class ParquetDataCatalog(BaseDataCatalog):
             bar_types=bar_types,
             start=start,
             end=end,
+            columns=columns,
         )
 
         assert (
@@ -577,9 +593,17 @@ class ParquetDataCatalog(BaseDataCatalog):
         start: TimestampLike | None = None,
         end: TimestampLike | None = None,
         ts_column: str = "ts_init",
+        columns: list[str] | None = None,
     ) -> pds.Dataset | None:
+        # Coalesce consecutive column chunks into buffered reads rather than
+        # materializing entire serialized row groups (lowers peak memory and
+        # the number of read calls, particularly for high-latency filesystems).
+        file_format = pds.ParquetFileFormat(
+            default_fragment_scan_options=pds.ParquetFragmentScanOptions(pre_buffer=True),
+        )
+
         # Original dataset
-        dataset = pds.dataset(path, filesystem=self.fs)
+        dataset = pds.dataset(path, filesystem=self.fs, format=file_format)
 
         # Instrument id filters (not stored in table, need to filter based on files)
         if instrument_ids is not None:
@@ -590,7 +614,7 @@ class ParquetDataCatalog(BaseDataCatalog):
                 for fn in dataset.files
                 if any(urisafe_instrument_id(x) in fn for x in instrument_ids)
             ]
-            dataset = pds.dataset(valid_files, filesystem=self.fs)
+            dataset = pds.dataset(valid_files, filesystem=self.fs, format=file_format)
 
         if bar_types is not None:
             if not isinstance(bar_types, list):
@@ -598,7 +622,7 @@ class ParquetDataCatalog(BaseDataCatalog):
             valid_files = [
                 fn for fn in dataset.files if any(x.replace("/", "") in fn for x in bar_types)
             ]
-            dataset = pds.dataset(valid_files, filesystem=self.fs)
+            dataset = pds.dataset(valid_files, filesystem=self.fs, format=file_format)
 
         filters: list[pds.Expression] = [filter_expr] if filter_expr is not None else []
         if start is not None:
@@ -609,7 +633,7 @@ class ParquetDataCatalog(BaseDataCatalog):
             filter_ = combine_filters(*filters)
         else:
             filter_ = None
-        return dataset.to_table(filter=filter_)
+        return dataset.to_table(filter=filter_, columns=columns)
 
     def _build_query(
         self,
@@ -636,18 +660,10 @@ class ParquetDataCatalog(BaseDataCatalog):
 
     @staticmethod
     def _nautilus_data_cls_to_data_type(data_cls: type) -> NautilusDataType:
-        if data_cls in (OrderBookDelta, OrderBookDeltas):
-            return NautilusDataType.OrderBookDelta
-        elif data_cls == OrderBookDepth10:
-            return NautilusDataType.OrderBookDepth10
-        elif data_cls == QuoteTick:
-            return NautilusDataType.QuoteTick
-        elif data_cls == TradeTick:
-            return NautilusDataType.TradeTick
-        elif data_cls == Bar:
-            return NautilusDataType.Bar
-        else:
+        data_type = _NAUTILUS_DATA_TYPES.get(data_cls)
+        if data_type is None:
             raise RuntimeError(f"unsupported `data_cls` for Rust parquet, was {data_cls.__name__}")
+        return data_type
 
     @staticmethod
     def _handle_table_nautilus(
@@ -756,7 +772,9 @@ class ParquetDataCatalog(BaseDataCatalog):
                 continue
 
             if table is None:
-                print(f"No data for {cls_name}")
+                if not is_logging_initialized():
+                    init_logging()
+                Logger(type(self).__name__).warning(f"No data for {cls_name}")
                 continue
             # Apply post read fixes
             try:
@@ -766,7 +784,9 @@ class ParquetDataCatalog(BaseDataCatalog):
             except Exception as e:
                 if raise_on_failed_deserialize:
                     raise
-                print(f"Failed to deserialize {cls_name}: {e}")
+                if not is_logging_initialized():
+                    init_logging()
+                Logger(type(self).__name__).warning(f"Failed to deserialize {cls_name}: {e}")
         return sorted(itertools.chain.from_iterable(data.values()), key=lambda x: x.ts_init)
 
     def _list_feather_files(
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import datetime as dt
+from collections.abc import Sequence
 from enum import Enum
 from io import TextIOWrapper
 from typing import Any, BinaryIO
@@ -268,7 +269,7 @@ class StreamingFeatherWriter:
         schema = self._schemas[cls]
         timestamp = self.clock.timestamp_ns()
         full_path = f"{self.path}/{table_name}_{timestamp}.feather"
-        print(full_path)
+        self.logger.debug(full_path)
 
         self.fs.makedirs(self.fs._parent(full_path), exist_ok=True)
         f = self.fs.open(full_path, "wb")
@@ -339,28 +340,15 @@ class StreamingFeatherWriter:
 
         return metadata
 
-    def write(self, obj: object) -> None:  # noqa: C901
-        """
-        Write the object to the stream.
-
-        Parameters
-        ----------
-        obj : object
-            The object to write.
-
-        Raises
-        ------
-        ValueError
-            If `obj` is ``None``.
-
-        """
-        PyCondition.not_none(obj, "obj")
-
+    def _resolve_writer(  # noqa: C901
+        self,
+        obj: object,
+    ) -> tuple[RecordBatchStreamWriter, str, type] | None:
         cls = obj.__class__
 
         # Check if an include types filter has been specified
         if self.include_types is not None and cls not in self.include_types:
-            return
+            return None
 
         if isinstance(obj, CustomData):
             cls = obj.data_type.type
@@ -384,22 +372,29 @@ class StreamingFeatherWriter:
             elif cls not in self.missing_writers:
                 self.logger.warning(f"Can't find writer for cls: {cls}")
                 self.missing_writers.add(cls)
-                return
+                return None
             else:
-                return
+                return None
 
         if table in self._per_instrument_writers:
             key = (table, obj.instrument_id.value)  # type: ignore
             if key in self._instrument_writers:
                 writer: RecordBatchStreamWriter = self._instrument_writers[key]
             else:
-                return
+                return None
         else:
             writer: RecordBatchStreamWriter = self._writers[table]  # type: ignore
 
-        serialized = ArrowSerializer.serialize_batch([obj], data_cls=cls)
-        if not serialized:
-            return
+        return writer, table, cls
+
+    def _write_table(
+        self,
+        writer: RecordBatchStreamWriter,
+        table: str,
+        cls: type,
+        serialized: pa.Table,
+        obj: object,
+    ) -> None:
         try:
             writer.write_table(serialized)
             self._file_sizes[table] = self._file_sizes.get(table, 0) + serialized.nbytes
@@ -414,6 +409,83 @@ class StreamingFeatherWriter:
             self.logger.error(f"ERROR = `{e}`")
             self.logger.debug(f"data = {obj}")
 
+    def write(self, obj: object) -> None:
+        """
+        Write the object to the stream.
+
+        Parameters
+        ----------
+        obj : object
+            The object to write.
+
+        Raises
+        ------
+        ValueError
+            If `obj` is ``None``.
+
+        """
+        PyCondition.not_none(obj, "obj")
+
+        resolved = self._resolve_writer(obj)
+        if resolved is None:
+            return
+
+        writer, table, cls = resolved
+        serialized = ArrowSerializer.serialize_batch([obj], data_cls=cls)
+        if not serialized:
+            return
+
+        self._write_table(writer, table, cls, serialized, obj)
+
+    def write_many(self, objs: Sequence[object]) -> None:
+        """
+        Write the given objects to the stream.
+
+        All objects destined for the same writer (same table, and same
+        instrument for per-instrument tables) are serialized as a single
+        record batch and written in a single call, amortizing the per-write
+        overhead compared with writing each object individually.
+
+        Parameters
+        ----------
+        objs : Sequence[object]
+            The objects to write.
+
+        Raises
+        ------
+        ValueError
+            If `objs` is ``None``.
+
+        """
+        PyCondition.not_none(objs, "objs")
+
+        # Buckets must be keyed per writer: per-instrument tables have one
+        # writer per (table, instrument_id), not one writer per table
+        buckets: dict[
+            str | tuple[str, str],
+            tuple[RecordBatchStreamWriter, str, type, list[object]],
+        ] = {}
+        for obj in objs:
+            resolved = self._resolve_writer(obj)
+            if resolved is None:
+                continue
+            writer, table, cls = resolved
+            if table in self._per_instrument_writers:
+                bucket_key: str | tuple[str, str] = (table, obj.instrument_id.value)  # type: ignore
+            else:
+                bucket_key = table
+            bucket = buckets.get(bucket_key)
+            if bucket is None:
+                buckets[bucket_key] = (writer, table, cls, [obj])
+            else:
+                bucket[3].append(obj)
+
+        for writer, table, cls, chunk in buckets.values():
+            serialized = ArrowSerializer.serialize_batch(chunk, data_cls=cls)
+            if not serialized:
+                continue
+            self._write_table(writer, table, cls, serialized, chunk[-1])
+
     def check_flush(self) -> None:
         """
         Flush all stream writers if current time greater than the next flush interval.
@@ -146,6 +146,47 @@ class TestBacktestNode:
         # Assert
         assert len(results) == 1
 
+    def test_backtest_run_parallel(self):
+        # Arrange
+        node = BacktestNode(configs=self.backtest_configs)
+
+        # Act
+        results = node.run(parallel=2)
+
+        # Assert
+        assert len(results) == 1
+
+    def test_backtest_run_reuse_engine(self):
+        # Arrange - two configs with an identical engine/venues/data setup
+        # but distinct run IDs (differing end times)
+        engine_config = BacktestEngineConfig(
+            strategies=self.strategies,
+            logging=LoggingConfig(bypass_logging=True),
+        )
+        config1 = BacktestRunConfig(
+            engine=engine_config,
+            venues=[self.venue_config],
+            data=[self.data_config],
+            dispose_on_completion=False,
+            end=1580504394501000000,
+        )
+        config2 = BacktestRunConfig(
+            engine=engine_config,
+            venues=[self.venue_config],
+            data=[self.data_config],
+            dispose_on_completion=False,
+            end=1580504394502000000,
+        )
+
+        node = BacktestNode(configs=[config1, config2])
+
+        # Act
+        results = node.run(reuse_engine=True)
+
+        # Assert - both runs produced results from a single engine instance
+        assert len(results) == 2
+        assert node.get_engine(config1.id) is node.get_engine(config2.id)
+
     def test_backtest_run_results(self):
         # Arrange
         node = BacktestNode(configs=self.backtest_configs)
@@ -0,0 +1,87 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pyarrow as pa
+
+from nautilus_trader.persistence.writer import StreamingFeatherWriter
+from nautilus_trader.test_kit.mocks.data import setup_catalog
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+class TestStreamingFeatherWriter:
+    def setup(self) -> None:
+        self.catalog = setup_catalog(protocol="memory", path="/catalog")
+        self.cache = TestComponentStubs.cache()
+        self.clock = TestComponentStubs.clock()
+        self.audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        self.gbpusd = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+        self.cache.add_instrument(self.audusd)
+        self.cache.add_instrument(self.gbpusd)
+        self.writer = StreamingFeatherWriter(
+            path=self.catalog.path,
+            cache=self.cache,
+            clock=self.clock,
+            fs_protocol=self.catalog.fs_protocol,
+            replace=True,
+        )
+
+    def test_write_many_routes_per_instrument_tables(self) -> None:
+        # Arrange
+        ticks = [
+            TestDataStubs.quote_tick(instrument=self.audusd, ts_init=1),
+            TestDataStubs.quote_tick(instrument=self.gbpusd, ts_init=2),
+            TestDataStubs.quote_tick(instrument=self.audusd, ts_init=3),
+        ]
+
+        # Act
+        self.writer.write_many(ticks)
+        self.writer.close()
+
+        # Assert - one writer per instrument, with each instrument's rows
+        # landing in its own feather file
+        assert set(self.writer._instrument_writers) == {
+            ("quote_tick", self.audusd.id.value),
+            ("quote_tick", self.gbpusd.id.value),
+        }
+
+        row_counts: dict[str, int] = {}
+        for path in self.writer.fs.glob(f"{self.catalog.path}/quote_tick/*.feather"):
+            with self.writer.fs.open(path, "rb") as f:
+                table = pa.ipc.open_stream(f).read_all()
+            instrument_id = table.schema.metadata[b"instrument_id"].decode()
+            row_counts[instrument_id] = table.num_rows
+        assert row_counts == {
+            self.audusd.id.value: 2,
+            self.gbpusd.id.value: 1,
+        }
+
+    def test_write_many_matches_write_for_single_table(self) -> None:
+        # Arrange
+        ticks = [
+            TestDataStubs.quote_tick(instrument=self.audusd, ts_init=i) for i in range(5)
+        ]
+
+        # Act
+        self.writer.write_many(ticks)
+        self.writer.close()
+
+        # Assert
+        paths = self.writer.fs.glob(f"{self.catalog.path}/quote_tick/*.feather")
+        assert len(paths) == 1
+        with self.writer.fs.open(paths[0], "rb") as f:
+            table = pa.ipc.open_stream(f).read_all()
+        assert table.num_rows == 5